@@ -14,46 +14,20 @@ def _get_libautohbw_path():
 class Test_autohbw(object):
     binary = "../autohbw_test_helper"
     fail_msg = "Test failed with:\n {0}"
-    test_prefix = "AUTO_HBW_LOG=2 LD_PRELOAD=%s " % _get_libautohbw_path()
-    memkind_malloc_log = "In my memkind malloc"
-    memkind_calloc_log = "In my memkind calloc"
-    memkind_realloc_log = "In my memkind realloc"
-    memkind_posix_memalign_log = "In my memkind align"
+    test_env = {"AUTO_HBW_LOG": "2", "LD_PRELOAD": _get_libautohbw_path()}
+    memkind_alloc_logs = {"malloc": "In my memkind malloc",
+                          "calloc": "In my memkind calloc",
+                          "realloc": "In my memkind realloc",
+                          "posix_memalign": "In my memkind align"}
     memkind_free_log = "In my memkind free"
     cmd_helper = CMD_helper()
 
-    def test_TC_MEMKIND_autohbw_malloc_and_free(self):
-        """ This test executes ./autohbw_test_helper with LD_PRELOAD that is overriding malloc() and free() to equivalent autohbw functions"""
-        command = self.test_prefix + self.cmd_helper.get_command_path(self.binary) + " malloc"
-        print("Executing command: {0}".format(command))
-        output, retcode = self.cmd_helper.execute_cmd(command, sudo=False)
+    @pytest.mark.parametrize("alloc_function", ["malloc", "calloc", "realloc", "posix_memalign"])
+    def test_TC_MEMKIND_autohbw_alloc_and_free(self, alloc_function):
+        """ This test executes ./autohbw_test_helper with LD_PRELOAD that is overriding given allocation function and free() to equivalent autohbw functions"""
+        command = [self.cmd_helper.get_command_path(self.binary), alloc_function]
+        print("Executing command: {0} with environment: {1}".format(command, self.test_env))
+        output, retcode = self.cmd_helper.execute_cmd(command, sudo=False, env=self.test_env)
         assert retcode == 0, self.fail_msg.format("\nError: autohbw_test_helper returned {0} \noutput: {1}".format(retcode,output))
-        assert self.memkind_malloc_log in output, self.fail_msg.format("\nError: malloc was not overridden by autohbw equivalent \noutput: {0}").format(output)
-        assert self.memkind_free_log in output, self.fail_msg.format("\nError: free was not overridden by autohbw equivalent \noutput: {0}").format(output)
-
-    def test_TC_MEMKIND_autohbw_calloc_and_free(self):
-        """ This test executes ./autohbw_test_helper with LD_PRELOAD that is overriding calloc() and free() to equivalent autohbw functions"""
-        command = self.test_prefix + self.cmd_helper.get_command_path(self.binary) + " calloc"
-        print("Executing command: {0}".format(command))
-        output, retcode = self.cmd_helper.execute_cmd(command, sudo=False)
-        assert retcode == 0, self.fail_msg.format("\nError: autohbw_test_helper returned {0} \noutput: {1}".format(retcode,output))
-        assert self.memkind_calloc_log in output, self.fail_msg.format("\nError: calloc was not overridden by autohbw equivalent \noutput: {0}").format(output)
-        assert self.memkind_free_log in output, self.fail_msg.format("Error: free was not overridden by autohbw equivalent \noutput: {0}").format(output)
-
-    def test_TC_MEMKIND_autohbw_realloc_and_free(self):
-        """ This test executes ./autohbw_test_helper with LD_PRELOAD that is overriding realloc() and free() to equivalent autohbw functions"""
-        command = self.test_prefix + self.cmd_helper.get_command_path(self.binary) + " realloc"
-        print("Executing command: {0}".format(command))
-        output, retcode = self.cmd_helper.execute_cmd(command, sudo=False)
-        assert retcode == 0, self.fail_msg.format("\nError: autohbw_test_helper returned {0} \noutput: {1}".format(retcode,output))
-        assert self.memkind_realloc_log in output, self.fail_msg.format("\nError: realloc was not overridden by autohbw equivalent \noutput: {0}").format(output)
-        assert self.memkind_free_log in output, self.fail_msg.format("\nError: free was not overridden by autohbw equivalent \noutput: {0}").format(output)
-
-    def test_TC_MEMKIND_autohbw_posix_memalign_and_free(self):
-        """ This test executes ./autohbw_test_helper with LD_PRELOAD that is overriding posix_memalign() and free() to equivalent autohbw functions"""
-        command = self.test_prefix + self.cmd_helper.get_command_path(self.binary) + " posix_memalign"
-        print("Executing command: {0}".format(command))
-        output, retcode = self.cmd_helper.execute_cmd(command, sudo=False)
-        assert retcode == 0, self.fail_msg.format("\nError: autohbw_test_helper returned {0} \noutput: {1}".format(retcode,output))
-        assert self.memkind_posix_memalign_log in output, self.fail_msg.format("\nError: posix_memalign was not overridden by autohbw equivalent \noutput: {0}").format(output)
+        assert self.memkind_alloc_logs[alloc_function] in output, self.fail_msg.format("\nError: {0} was not overridden by autohbw equivalent \noutput: {1}").format(alloc_function, output)
         assert self.memkind_free_log in output, self.fail_msg.format("\nError: free was not overridden by autohbw equivalent \noutput: {0}").format(output)
@@ -16,12 +16,13 @@ class Test_dax_kmem_env_var(object):
 
     def get_dax_kmem_nodes(self, nodemask=None):
         """ This function executes memkind function 'get_mbind_nodemask' and returns its output - comma-separated DAX_KMEM nodes """
-        command = self.binary_path
+        command = [self.binary_path]
+        env = None
         if (nodemask):
-            command = "MEMKIND_DAX_KMEM_NODES={}".format(nodemask) + command
-        output, retcode = self.cmd_helper.execute_cmd(command)
-        assert retcode == 0, self.fail_msg.format("\nError: Execution of \'{0}\' returns {1}, \noutput: {2}".format(command, retcode, output))
-        print("\nExecution of {} returns output {}".format(command, output))
+            env = {"MEMKIND_DAX_KMEM_NODES": nodemask.strip()}
+        output, retcode = self.cmd_helper.execute_cmd(command, env=env)
+        assert retcode == 0, self.fail_msg.format("\nError: Execution of \'{0}\' with environment {1} returns {2}, \noutput: {3}".format(command, env, retcode, output))
+        print("\nExecution of {} with environment {} returns output {}".format(command, env, output))
         return output
 
     def test_TC_MEMKIND_dax_kmem_env_var_compare_nodemask_default_and_env_variable(self):
@@ -33,15 +34,17 @@ class Test_dax_kmem_env_var(object):
 
     def test_TC_MEMKIND_dax_kmem_env_var_negative_memkind_malloc(self):
         """ This test sets unsupported value of MEMKIND_DAX_KMEM_NODES, then tries to perform a successful allocation from DRAM using memkind_malloc() """
-        command = "MEMKIND_DAX_KMEM_NODES=-1 " + self.cmd_helper.get_command_path(self.environ_err_test)
-        output, retcode = self.cmd_helper.execute_cmd(command)
-        assert retcode != 0, self.fail_msg.format("\nError: Execution of: \'{0}\' returns: {1} \noutput: {2}".format(command, retcode, output))
+        env = {"MEMKIND_DAX_KMEM_NODES": "-1"}
+        command = [self.cmd_helper.get_command_path(self.environ_err_test)]
+        output, retcode = self.cmd_helper.execute_cmd(command, env=env)
+        assert retcode != 0, self.fail_msg.format("\nError: Execution of: \'{0}\' with environment {1} returns: {2} \noutput: {3}".format(command, env, retcode, output))
         assert self.expected_libnuma_warning == output, self.fail_msg.format("Error: expected libnuma warning ({0}) " \
                "was not found (output: {1})").format(self.expected_libnuma_warning, output)
 
     def test_TC_MEMKIND_dax_kmem_env_var_proper_memkind_malloc(self):
         """ This test checks if allocation is performed on persistent memory correctly """
         dax_kmem_nodemask_default = self.get_dax_kmem_nodes().strip()
-        command = "MEMKIND_DAX_KMEM_NODES={} ".format(dax_kmem_nodemask_default) + self.cmd_helper.get_command_path(self.environ_err_positive_test)
-        output, retcode = self.cmd_helper.execute_cmd(command)
-        assert retcode == 0, self.fail_msg.format("\nError: Execution of: \'{0}\' returns: {1} \noutput: {2}".format(command, retcode, output))
+        env = {"MEMKIND_DAX_KMEM_NODES": dax_kmem_nodemask_default}
+        command = [self.cmd_helper.get_command_path(self.environ_err_positive_test)]
+        output, retcode = self.cmd_helper.execute_cmd(command, env=env)
+        assert retcode == 0, self.fail_msg.format("\nError: Execution of: \'{0}\' with environment {1} returns: {2} \noutput: {3}".format(command, env, retcode, output))
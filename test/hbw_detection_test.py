@@ -15,12 +15,13 @@ class Test_hbw_detection(object):
 
     def get_hbw_nodes(self, nodemask=None):
         """ This function executes memkind function 'get_mbind_nodemask' and returns its output - comma-separated HBW nodes """
-        command = self.binary_path
+        command = [self.binary_path]
+        env = None
         if (nodemask):
-            command = "MEMKIND_HBW_NODES={}".format(nodemask) + command
-        output, retcode = self.cmd_helper.execute_cmd(command, sudo=False)
-        assert retcode == 0, self.fail_msg.format("\nError: Execution of \'{0}\' returns {1}, \noutput: {2}".format(command, retcode, output))
-        print("\nExecution of {} returns output {}".format(command, output))
+            env = {"MEMKIND_HBW_NODES": nodemask.strip()}
+        output, retcode = self.cmd_helper.execute_cmd(command, sudo=False, env=env)
+        assert retcode == 0, self.fail_msg.format("\nError: Execution of \'{0}\' with environment {1} returns {2}, \noutput: {3}".format(command, env, retcode, output))
+        print("\nExecution of {} with environment {} returns output {}".format(command, env, output))
         return output
 
     def test_TC_MEMKIND_hbw_detection_compare_nodemask_default_and_env_variable(self):
@@ -33,8 +34,9 @@ class Test_hbw_detection(object):
     def test_TC_MEMKIND_hbw_detection_negative_hbw_malloc(self):
         """ This test sets unsupported value of MEMKIND_HBW_NODES, then try to perform a successful allocation from DRAM using hbw_malloc()
         thanks to default HBW_POLICY_PREFERRED policy """
-        command = "MEMKIND_HBW_NODES=-1 " + self.cmd_helper.get_command_path(self.environ_err_test)
-        output, retcode = self.cmd_helper.execute_cmd(command, sudo=False)
-        assert retcode != 0, self.fail_msg.format("\nError: Execution of: \'{0}\' returns: {1} \noutput: {2}".format(command, retcode, output))
+        env = {"MEMKIND_HBW_NODES": "-1"}
+        command = [self.cmd_helper.get_command_path(self.environ_err_test)]
+        output, retcode = self.cmd_helper.execute_cmd(command, sudo=False, env=env)
+        assert retcode != 0, self.fail_msg.format("\nError: Execution of: \'{0}\' with environment {1} returns: {2} \noutput: {3}".format(command, env, retcode, output))
         assert self.expected_libnuma_warning == output, self.fail_msg.format("Error: expected libnuma warning ({0}) " \
                "was not found (output: {1})").format(self.expected_libnuma_warning, output)
@@ -10,13 +10,13 @@ class Test_hbw_env_var(object):
     cmd_helper = CMD_helper()
 
     def run_test(self, threshold, kind):
-        env = "MEMKIND_HBW_THRESHOLD=" + str(threshold)
+        env = {"MEMKIND_HBW_THRESHOLD": str(threshold)}
         bin_path = self.cmd_helper.get_command_path(self.environ_err_threshold_test)
-        command = " ".join([env, bin_path, kind])
-        output, retcode = self.cmd_helper.execute_cmd(command)
+        command = [bin_path, kind]
+        output, retcode = self.cmd_helper.execute_cmd(command, env=env)
         print(output)
-        fail_msg = f"Test failed with error: \nExecution of: \'{command}\' returns: {retcode} \noutput: {output}"
-        assert retcode == 0, fail_msg
+        assert retcode == 0, \
+               f"Test failed with error: \nExecution of: \'{command}\' with environment {env} returns: {retcode} \noutput: {output}"
 
     @pytest.mark.parametrize("kind", ["MEMKIND_HBW", "MEMKIND_HBW_ALL"])
     def test_TC_MEMKIND_hbw_threshold_default_value(self, kind):
@@ -16,10 +16,11 @@ class Test_max_bg_threads_env_var():
         return self.MAIN_THREAD + self.threads_limit
 
     def run_test_binary(self):
-        command = f"MEMKIND_BACKGROUND_THREAD_LIMIT={self.threads_limit} {self.cmd_helper.get_command_path('../environ_max_bg_threads_test')}"
-        output, retcode = self.cmd_helper.execute_cmd(command)
+        env = {"MEMKIND_BACKGROUND_THREAD_LIMIT": str(self.threads_limit)}
+        command = [self.cmd_helper.get_command_path('../environ_max_bg_threads_test')]
+        output, retcode = self.cmd_helper.execute_cmd(command, env=env)
         assert retcode != 1, \
-               self.fail_msg.format(f"\nError: Execution of \'{command}\' returns {retcode}. Output: {output}")
+               self.fail_msg.format(f"\nError: Execution of \'{command}\' with environment {env} returns {retcode}. Output: {output}")
         return output, retcode
 
     def test_TC_MEMKIND_max_bg_threads_env_var_min(self):
@@ -47,4 +48,4 @@ class Test_max_bg_threads_env_var():
         output, retcode = self.run_test_binary()
         assert retcode == 134, \
                self.fail_msg.format(f"Error: Negative value of MEMKIND_BACKGROUND_THREAD_LIMIT should not be handled. " \
-                                    f"Counted threads: {threads_count}. Output: {output}")
+                                    f"Output: {output}")
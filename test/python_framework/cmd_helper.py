@@ -5,17 +5,33 @@ import pytest
 import os
 import tempfile
 import subprocess
+import shlex
 
 class CMD_helper(object):
 
-    def execute_cmd(self, command, sudo=False):
+    def execute_cmd(self, command, sudo=False, env=None):
+        """Execute command and return its output and return code.
+        String command is run through the shell, list command is executed directly
+        as argv without spawning a shell. Variables from env are added to the current
+        environment. With sudo, env_reset would drop them, so they are
+        passed as arguments of env(1) run by sudo instead."""
+        shell = isinstance(command, str)
         if sudo:
-            command = "sudo {0}".format(command)
+            sudo_args = ["sudo"]
+            if env:
+                sudo_args += ["env"] + ["{0}={1}".format(key, value) for key, value in env.items()]
+                env = None
+            if shell:
+                command = " ".join([shlex.quote(arg) for arg in sudo_args] + [command])
+            else:
+                command = sudo_args + command
+        if env is not None:
+            env = dict(os.environ, **env)
         #Initialize temp file for stdout. Will be removed when closed.
         outfile = tempfile.SpooledTemporaryFile()
         try:
             #Invoke process
-            p = subprocess.Popen(command, stdout=outfile, stderr=subprocess.STDOUT, shell=True)
+            p = subprocess.Popen(command, stdout=outfile, stderr=subprocess.STDOUT, shell=shell, env=env)
             p.communicate()
             #Read stdout from file
             outfile.seek(0)